@@ -6,6 +6,12 @@ from dataclasses import dataclass
 from pathlib import Path
 
 
+# Parsed configs keyed by path, invalidated when the file's mtime changes.
+# The launchd service re-loads config on every keep-alive restart, so
+# skipping the re-parse is worth it.
+_CONFIG_CACHE: dict[Path, tuple[int, "Config"]] = {}
+
+
 @dataclass
 class Config:
     """Application configuration."""
@@ -17,14 +23,21 @@ class Config:
     
     @classmethod
     def from_file(cls, path: Path) -> "Config":
-        """Load config from a JSON file."""
+        """Load config from a JSON file, reusing a cached parse if unchanged."""
+        mtime_ns = path.stat().st_mtime_ns
+        cached = _CONFIG_CACHE.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
         data = json.loads(path.read_text())
-        return cls(
+        config = cls(
             notion_api_key=data["notion_api_key"],
             notion_database_id=data["notion_database_id"],
             sync_interval_seconds=data.get("sync_interval_seconds", 30),
             voiceink_db_path=data.get("voiceink_db_path"),
         )
+        _CONFIG_CACHE[path] = (mtime_ns, config)
+        return config
     
     @classmethod
     def from_env(cls) -> "Config":
@@ -59,11 +72,14 @@ def load_config(config_path: Path | None = None) -> Config:
     2. Default config file location
     3. Environment variables
     """
-    if config_path and config_path.exists():
+    # os.path.exists avoids pathlib's per-call overhead in the startup path
+    exists = os.path.exists
+
+    if config_path and exists(str(config_path)):
         return Config.from_file(config_path)
-    
+
     default_path = get_default_config_path()
-    if default_path.exists():
+    if exists(str(default_path)):
         return Config.from_file(default_path)
     
     # Fall back to environment variables
@@ -1,31 +1,121 @@
 """Main entry point for VoiceInk to Notion sync."""
 
 import argparse
+import asyncio
+import json
+import os
+import re
+import shutil
+import signal
+import string
 import subprocess
 import sys
 import time
+from heapq import nlargest
+from itertools import islice
 from pathlib import Path
 
-from rich.console import Console
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
-
 from .config import load_config, get_default_config_path, Config
-from .notion_client import NotionClient, NotionConfig
-from .sync_tracker import load_sync_state, save_sync_state
-from .voiceink_reader import find_voiceink_database, read_transcriptions
+from .sync_tracker import SyncBatch, load_sync_state, save_sync_state, hash_api_key
+
+# Rich and the httpx/sqlite-backed modules are imported lazily inside the
+# commands that need them: launchd's KeepAlive cold-starts this CLI on
+# every crash restart, and commands like `service`, `logs`, or `uninstall`
+# shouldn't pay for those imports.
+
+
+class _LazyConsole:
+    """Defers importing rich until the first print.
+
+    Dunder lookups bypass __getattr__ (CPython resolves them on the
+    type), so the context-manager hooks are delegated explicitly —
+    rich's Live.stop() runs `with self.console:` when a Progress bar
+    finishes, which would otherwise raise TypeError.
+    """
+
+    _console = None
+
+    @classmethod
+    def _resolve(cls):
+        if cls._console is None:
+            from rich.console import Console
+            cls._console = Console()
+        return cls._console
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __enter__(self):
+        return self._resolve().__enter__()
+
+    def __exit__(self, exc_type, exc, tb):
+        return self._resolve().__exit__(exc_type, exc, tb)
+
+
+console = _LazyConsole()
 
+# A Notion database ID is 32 hex chars (dashes stripped beforehand)
+_NOTION_ID_RE = re.compile(r"[0-9a-fA-F]{32}")
 
-console = Console()
+_HOME = Path.home()
 
 # launchd service configuration
 LAUNCHD_LABEL = "com.voiceink-to-notion.sync"
-LAUNCHD_PLIST_PATH = Path.home() / "Library" / "LaunchAgents" / f"{LAUNCHD_LABEL}.plist"
-LOG_DIR = Path.home() / ".config" / "voiceink-to-notion" / "logs"
+LAUNCHD_PLIST_PATH = _HOME / "Library" / "LaunchAgents" / f"{LAUNCHD_LABEL}.plist"
+LOG_DIR = _HOME / ".config" / "voiceink-to-notion" / "logs"
+_PROJECT_DIR = Path(__file__).parent.parent.resolve()
+
+# Compiled once; only the varying pieces are substituted at install time.
+# Use uv run to properly handle the venv and dependencies.
+_PLIST_TEMPLATE = string.Template("""<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>Label</key>
+    <string>$label</string>
+
+    <key>ProgramArguments</key>
+    <array>
+        <string>$uv_path</string>
+        <string>run</string>
+        <string>voiceink-to-notion</string>
+        <string>sync</string>
+    </array>
+
+    <key>WorkingDirectory</key>
+    <string>$project_dir</string>
+
+    <key>RunAtLoad</key>
+    <true/>
+
+    <key>KeepAlive</key>
+    <true/>
+
+    <key>StandardOutPath</key>
+    <string>$log_dir/stdout.log</string>
+
+    <key>StandardErrorPath</key>
+    <string>$log_dir/stderr.log</string>
+
+    <key>EnvironmentVariables</key>
+    <dict>
+        <key>PATH</key>
+        <string>$home/.cargo/bin:$home/.local/bin:/opt/homebrew/bin:/usr/local/bin:/usr/bin:/bin</string>
+        <key>HOME</key>
+        <string>$home</string>
+    </dict>
+
+    <key>ThrottleInterval</key>
+    <integer>30</integer>
+</dict>
+</plist>
+""")
 
 
 def interactive_setup() -> Config | None:
     """Run interactive setup to create config."""
+    from rich.prompt import Prompt
+
     console.print("\n[bold blue]VoiceInk to Notion Setup[/bold blue]\n")
     
     console.print("[dim]To set this up, you need:[/dim]")
@@ -45,11 +135,9 @@ def interactive_setup() -> Config | None:
     database_id = database_id.replace("-", "")
     if "notion.so" in database_id:
         # Try to extract ID from URL
-        parts = database_id.split("/")
-        for part in parts:
-            if len(part) >= 32 and part[:32].replace("-", "").isalnum():
-                database_id = part[:32].replace("-", "")
-                break
+        match = _NOTION_ID_RE.search(database_id)
+        if match:
+            database_id = match.group(0)
     
     config = Config(
         notion_api_key=api_key,
@@ -59,27 +147,53 @@ def interactive_setup() -> Config | None:
     # Save config
     config_path = get_default_config_path()
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    config_path.write_text(f'''{{
-    "notion_api_key": "{api_key}",
-    "notion_database_id": "{database_id}",
-    "sync_interval_seconds": 30
-}}
-''')
-    
+    new_content = json.dumps(
+        {
+            "notion_api_key": api_key,
+            "notion_database_id": database_id,
+            "sync_interval_seconds": 30,
+        },
+        indent=4,
+    ) + "\n"
+
+    # Skip the write when nothing changed, so the file's mtime (and the
+    # caches keyed on it) stay intact across setup re-runs
+    if config_path.exists() and config_path.read_bytes() == new_content.encode():
+        console.print(f"\n[green]Config unchanged at {config_path}[/green]")
+        return config
+
+    tmp_path = config_path.with_suffix(".json.tmp")
+    tmp_path.write_text(new_content)
+    os.replace(tmp_path, config_path)
+
     console.print(f"\n[green]Config saved to {config_path}[/green]")
     return config
 
 
-def validate_and_setup(config: Config) -> NotionClient | None:
-    """Validate configuration and setup, returning client if successful."""
+def validate_and_setup(config: Config) -> "tuple[NotionClient, Path] | None":
+    """Validate configuration and setup.
+
+    Returns (client, db_path) on success so callers don't have to search
+    for the VoiceInk database a second time.
+    """
+    from rich.prompt import Confirm
+
+    from .notion_client import NotionClient, NotionConfig, schema_signature
+    from .voiceink_reader import find_voiceink_database, read_transcriptions
+
     console.print("\n[bold]VoiceInk to Notion[/bold]\n")
-    
+
     # Check VoiceInk database
-    db_path = find_voiceink_database()
+    if config.voiceink_db_path:
+        db_path = Path(config.voiceink_db_path)
+        if not db_path.is_file():
+            db_path = None
+    else:
+        db_path = find_voiceink_database()
     if db_path:
         try:
-            transcriptions = read_transcriptions(db_path)
-            console.print(f"├─ VoiceInk DB: [green]✓[/green] Found ({len(transcriptions)} transcriptions)")
+            transcription_count = sum(1 for _ in read_transcriptions(db_path))
+            console.print(f"├─ VoiceInk DB: [green]✓[/green] Found ({transcription_count} transcriptions)")
         except Exception as e:
             console.print(f"├─ VoiceInk DB: [red]✗[/red] Error reading: {e}")
             return None
@@ -88,44 +202,74 @@ def validate_and_setup(config: Config) -> NotionClient | None:
         console.print("   [dim]Make sure VoiceInk is installed and has transcription history[/dim]")
         return None
     
-    # Create client and test connection
+    # Create client and test connection (reuse a recent successful check so
+    # back-to-back commands skip the extra API round-trip)
     client = NotionClient(NotionConfig(
         api_key=config.notion_api_key,
         database_id=config.notion_database_id,
     ))
-    
-    conn_result = client.test_connection()
-    if conn_result.success:
-        console.print(f"├─ Notion: [green]✓[/green] Connected to \"{conn_result.database_name}\"")
+
+    state = load_sync_state()
+    # Hydrate the detected title property from a previous run so page
+    # creation works even before check_schema has run in this process
+    if state.title_property:
+        client.title_property = state.title_property
+    key_hash = hash_api_key(config.notion_api_key)
+    if state.connection_fresh(key_hash):
+        console.print(f"├─ Notion: [green]✓[/green] Connected to \"{state.last_connection_db_name}\" [dim](cached)[/dim]")
     else:
-        console.print(f"├─ Notion: [red]✗[/red] {conn_result.error}")
-        return None
+        conn_result = client.test_connection()
+        if conn_result.success:
+            console.print(f"├─ Notion: [green]✓[/green] Connected to \"{conn_result.database_name}\"")
+            state.record_connection(conn_result.database_name, key_hash)
+            save_sync_state(state)
+        else:
+            console.print(f"├─ Notion: [red]✗[/red] {conn_result.error}")
+            return None
     
-    # Check schema
-    schema_result = client.check_schema()
-    if schema_result.valid:
-        console.print("├─ Schema: [green]✓[/green] Valid")
+    # Check schema, skipping the round-trip when this code's property
+    # expectations haven't changed since the last validated run
+    expected_schema = schema_signature()
+    if state.schema_hash == expected_schema and state.title_property:
+        console.print("├─ Schema: [green]✓[/green] Valid [dim](cached)[/dim]")
     else:
-        console.print(f"├─ Schema: [yellow]![/yellow] Missing properties: {', '.join(schema_result.missing_properties)}")
-        
-        if Confirm.ask("   Create missing properties?", default=True):
-            if client.setup_schema():
-                console.print("├─ Schema: [green]✓[/green] Properties created")
-            else:
-                console.print("├─ Schema: [red]✗[/red] Failed to create properties")
-                return None
+        schema_result = client.check_schema()
+        if schema_result.title_property and schema_result.title_property != state.title_property:
+            state.title_property = schema_result.title_property
+            save_sync_state(state)
+        if schema_result.valid:
+            console.print("├─ Schema: [green]✓[/green] Valid")
+            state.schema_hash = expected_schema
+            save_sync_state(state)
         else:
-            console.print("   [dim]Sync may fail without required properties[/dim]")
+            console.print(f"├─ Schema: [yellow]![/yellow] Missing properties: {', '.join(schema_result.missing_properties)}")
+
+            if Confirm.ask("   Create missing properties?", default=True):
+                if client.setup_schema():
+                    console.print("├─ Schema: [green]✓[/green] Properties created")
+                    state.schema_hash = expected_schema
+                    save_sync_state(state)
+                else:
+                    console.print("├─ Schema: [red]✗[/red] Failed to create properties")
+                    return None
+            else:
+                console.print("   [dim]Sync may fail without required properties[/dim]")
     
-    # Load sync state
-    state = load_sync_state()
     console.print(f"└─ Synced: [blue]{len(state.synced_ids)}[/blue] transcriptions")
-    
-    return client
+
+    return client, db_path
 
 
 def sync_command(args):
     """Run the sync process."""
+    from rich.progress import Progress
+    from rich.text import Text
+
+    from .notion_client import AsyncNotionClient
+    from .voiceink_reader import read_transcriptions
+
+    fail_prefix = Text.from_markup("[red]✗[/red] ")
+
     # Load or create config
     config_path = Path(args.config) if args.config else None
     
@@ -138,66 +282,166 @@ def sync_command(args):
             console.print("[red]Setup cancelled[/red]")
             return 1
     
-    # Validate and setup
-    client = validate_and_setup(config)
-    if not client:
+    # Validate and setup (also hands back the discovered VoiceInk DB path)
+    result = validate_and_setup(config)
+    if not result:
         return 1
-    
-    # Find VoiceInk database
-    if config.voiceink_db_path:
-        db_path = Path(config.voiceink_db_path)
-    else:
-        db_path = find_voiceink_database()
-    
+    client, db_path = result
+
     # Load sync state
     state = load_sync_state()
     
     # On first run (or if cache not populated), fetch existing IDs from Notion
     if not state.notion_cache_populated:
         console.print("\n[dim]Fetching existing entries from Notion...[/dim]")
-        notion_ids = client.get_all_synced_ids()
+        notion_ids = client.get_all_synced_ids(known_ids=state.synced_ids or None)
         if notion_ids:
             state.merge_notion_ids(notion_ids)
             save_sync_state(state)
             console.print(f"[dim]Found {len(notion_ids)} existing entries in Notion[/dim]")
     
+    # Cache the last parse keyed on the DB file's (mtime, size). Most ticks
+    # see an unchanged file, so we can skip re-reading it entirely.
+    read_cache = {"key": None, "transcriptions": []}
+
+    def pipelined_cold_sync(cache_key) -> int:
+        """First full read: stream SQLite rows straight into the upload.
+
+        The initial parse is the one expensive read, so instead of
+        materializing the whole history before the first POST, a producer
+        pulls rows from the generator in executor-run chunks (sqlite3
+        blocks) and feeds a bounded queue, while consumer tasks POST to
+        Notion — disk and network overlap instead of running back to back.
+        Warm ticks keep the cached-list fast path in do_sync.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        async def run() -> int:
+            loop = asyncio.get_running_loop()
+            queue: asyncio.Queue = asyncio.Queue(maxsize=50)
+            rows: list = []
+            synced_ids = state.synced_ids
+            gen = read_transcriptions(db_path)
+            consumers = 3
+
+            async def produce():
+                # One dedicated worker so the sqlite3 connection inside the
+                # generator always runs on the same thread
+                with ThreadPoolExecutor(max_workers=1) as reader:
+                    while True:
+                        chunk = await loop.run_in_executor(
+                            reader, lambda: list(islice(gen, 100))
+                        )
+                        if not chunk:
+                            break
+                        rows.extend(chunk)
+                        for t in chunk:
+                            if t.id not in synced_ids:
+                                await queue.put(t)
+                for _ in range(consumers):
+                    await queue.put(None)
+
+            count = 0
+            async with AsyncNotionClient(
+                client.config, title_property=client.title_property
+            ) as aclient:
+                with SyncBatch(state) as batch, \
+                        Progress(console=console, transient=True) as progress:
+                    task = progress.add_task("Syncing new transcriptions", total=None)
+
+                    async def consume():
+                        nonlocal count
+                        while (t := await queue.get()) is not None:
+                            result = await aclient.create_transcription_page(
+                                text=t.text,
+                                timestamp=t.timestamp,
+                                duration=t.duration,
+                                enhanced_text=t.enhanced_text,
+                                prompt_name=t.prompt_name,
+                                voiceink_id=t.id,
+                            )
+                            if result:
+                                batch.add(t.id)
+                                count += 1
+                            else:
+                                progress.console.print(fail_prefix + Text(f"Failed: {t.id[:8]}..."))
+                            progress.advance(task)
+
+                    await asyncio.gather(produce(), *(consume() for _ in range(consumers)))
+
+            read_cache["key"] = cache_key
+            read_cache["transcriptions"] = rows
+            return count
+
+        return asyncio.run(run())
+
     def do_sync() -> int:
         """Perform one sync cycle. Returns number synced."""
         try:
-            transcriptions = read_transcriptions(db_path)
+            st = os.stat(db_path)
+            cache_key = (st.st_mtime_ns, st.st_size)
+            if cache_key == read_cache["key"]:
+                transcriptions = read_cache["transcriptions"]
+            elif read_cache["transcriptions"]:
+                # File changed but we have a previous parse: only fetch
+                # rows newer than the newest one we've seen (list is
+                # newest-first), letting SQLite skip the rest. The since
+                # cursor round-trips the stored float through datetime at
+                # microsecond precision and can land just below it, so the
+                # query may re-return rows we already hold — drop anything
+                # whose ID is already cached before prepending.
+                cached = read_cache["transcriptions"]
+                cached_ids = {t.id for t in cached}
+                new_rows = [
+                    t for t in read_transcriptions(db_path, since=cached[0].timestamp)
+                    if t.id not in cached_ids
+                ]
+                transcriptions = new_rows + cached
+                read_cache["key"] = cache_key
+                read_cache["transcriptions"] = transcriptions
+            else:
+                # Cold path: pipeline the full read with the upload
+                return pipelined_cold_sync(cache_key)
         except Exception as e:
             console.print(f"[red]Error reading VoiceInk:[/red] {e}")
             return 0
         
-        # Find unsynced transcriptions
-        unsynced = [t for t in transcriptions if not state.is_synced(t.id)]
+        # Find unsynced transcriptions; bind the set to a local so the hot
+        # filter is a plain hash lookup per item
+        synced_ids = state.synced_ids
+        unsynced = [t for t in transcriptions if t.id not in synced_ids]
         
         if not unsynced:
             return 0
         
-        console.print(f"[yellow]Syncing {len(unsynced)} new transcriptions...[/yellow]")
-        
-        synced_count = 0
-        for t in unsynced:
-            result = client.create_transcription_page(
-                text=t.text,
-                timestamp=t.timestamp,
-                duration=t.duration,
-                enhanced_text=t.enhanced_text,
-                prompt_name=t.prompt_name,
-                voiceink_id=t.id,
-            )
-            
-            if result:
-                state.mark_synced(t.id)
-                save_sync_state(state)
-                text_preview = t.text[:40] + "..." if len(t.text) > 40 else t.text
-                console.print(f"[green]✓[/green] {text_preview}")
-                synced_count += 1
-            else:
-                console.print(f"[red]✗[/red] Failed: {t.id[:8]}...")
-        
-        return synced_count
+        # Page creation is I/O-bound on Notion round-trips, so fan the
+        # POSTs out with asyncio; create_transcription_pages caps the
+        # requests in flight at Notion's rate limit. A single progress bar replaces
+        # per-item markup prints, and SyncBatch checkpoints the state file
+        # every 25 successes plus a final flush on exit.
+        async def upload() -> int:
+            async with AsyncNotionClient(
+                client.config, title_property=client.title_property
+            ) as aclient:
+                with SyncBatch(state) as batch, \
+                        Progress(console=console, transient=True) as progress:
+                    task = progress.add_task(
+                        f"Syncing {len(unsynced)} new transcriptions",
+                        total=len(unsynced),
+                    )
+
+                    def on_result(t, result):
+                        if result:
+                            batch.add(t.id)
+                        else:
+                            progress.console.print(fail_prefix + Text(f"Failed: {t.id[:8]}..."))
+                        progress.advance(task)
+
+                    return await aclient.create_transcription_pages(
+                        unsynced, on_result=on_result
+                    )
+
+        return asyncio.run(upload())
     
     # Determine mode
     if args.once:
@@ -212,13 +456,16 @@ def sync_command(args):
         # Continuous sync (--always is default)
         console.print(f"\n[blue]Watching for new transcriptions (every {config.sync_interval_seconds}s)[/blue]")
         console.print("[dim]Press Ctrl+C to stop[/dim]\n")
-        
+
+        # launchd stops us with SIGTERM; turn it into a normal exit so the
+        # flush in do_sync's finally block runs
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
         try:
             while True:
                 synced = do_sync()
-                if synced == 0:
-                    # No new items, just show a dot to indicate we're alive
-                    pass
+                if synced:
+                    console.print(f"[green]✓[/green] Synced {synced} transcriptions")
                 time.sleep(config.sync_interval_seconds)
         except KeyboardInterrupt:
             console.print("\n[yellow]Stopped[/yellow]")
@@ -229,6 +476,9 @@ def sync_command(args):
 
 def status_command(args):
     """Show current sync status."""
+    from .notion_client import NotionClient, NotionConfig
+    from .voiceink_reader import find_voiceink_database, read_transcriptions
+
     console.print("\n[bold blue]VoiceInk to Notion Status[/bold blue]\n")
     
     # Check VoiceInk database
@@ -236,8 +486,8 @@ def status_command(args):
     if db_path:
         console.print(f"[green]VoiceInk DB:[/green] {db_path}")
         try:
-            transcriptions = read_transcriptions(db_path)
-            console.print(f"[green]Total transcriptions:[/green] {len(transcriptions)}")
+            transcription_count = sum(1 for _ in read_transcriptions(db_path))
+            console.print(f"[green]Total transcriptions:[/green] {transcription_count}")
         except Exception as e:
             console.print(f"[red]Error reading database:[/red] {e}")
     else:
@@ -254,45 +504,52 @@ def status_command(args):
     try:
         config = load_config()
         console.print("[green]Config:[/green] Loaded")
-        
-        # Test Notion connection
-        client = NotionClient(NotionConfig(
-            api_key=config.notion_api_key,
-            database_id=config.notion_database_id,
-        ))
-        conn_result = client.test_connection()
-        if conn_result.success:
-            console.print(f"[green]Notion:[/green] Connected to \"{conn_result.database_name}\"")
+
+        # Test Notion connection, reusing a recent check when possible
+        key_hash = hash_api_key(config.notion_api_key)
+        if state.connection_fresh(key_hash):
+            console.print(f"[green]Notion:[/green] Connected to \"{state.last_connection_db_name}\" [dim](cached)[/dim]")
         else:
-            console.print(f"[red]Notion:[/red] {conn_result.error}")
-        client.close()
+            client = NotionClient(NotionConfig(
+                api_key=config.notion_api_key,
+                database_id=config.notion_database_id,
+            ))
+            conn_result = client.test_connection()
+            if conn_result.success:
+                console.print(f"[green]Notion:[/green] Connected to \"{conn_result.database_name}\"")
+                state.record_connection(conn_result.database_name, key_hash)
+                save_sync_state(state)
+            else:
+                console.print(f"[red]Notion:[/red] {conn_result.error}")
     except Exception as e:
         console.print(f"[red]Config:[/red] {e}")
 
 
 def list_command(args):
     """List recent transcriptions."""
+    from rich.table import Table
+
+    from .voiceink_reader import find_voiceink_database, read_transcriptions
+
     db_path = find_voiceink_database()
     if not db_path:
         console.print("[red]VoiceInk database not found[/red]")
         return
-    
+
+    # Push the limit into SQL so the DB only returns the most recent N
+    limit = args.limit or 10
     try:
-        transcriptions = read_transcriptions(db_path)
+        transcriptions = list(read_transcriptions(db_path, limit=limit))
     except Exception as e:
         console.print(f"[red]Error reading database:[/red] {e}")
         return
-    
+
     if not transcriptions:
         console.print("[yellow]No transcriptions found[/yellow]")
         return
-    
-    # Sort by timestamp, newest first
-    transcriptions.sort(key=lambda t: t.timestamp, reverse=True)
-    
-    # Show only the most recent N
-    limit = args.limit or 10
-    transcriptions = transcriptions[:limit]
+
+    # Top-K by timestamp, newest first (O(N log K) instead of a full sort)
+    transcriptions = nlargest(limit, transcriptions, key=lambda t: t.timestamp)
     
     state = load_sync_state()
     
@@ -317,23 +574,35 @@ def list_command(args):
 
 def reset_command(args):
     """Reset sync state."""
+    from rich.prompt import Confirm
+
     if Confirm.ask("This will reset the sync state. Continue?", default=False):
-        state_file = get_default_config_path().parent / "sync_state.json"
-        if state_file.exists():
-            state_file.unlink()
+        state_dir = get_default_config_path().parent
+        for name in ("sync_state.json", "sync_state.log"):
+            state_file = state_dir / name
+            if state_file.exists():
+                state_file.unlink()
         console.print("[green]Sync state reset[/green]")
     else:
         console.print("[yellow]Cancelled[/yellow]")
 
 
+_PYTHON_PATH: str | None = None
+_UV_PATH: str | None = None
+
+
 def _get_python_path() -> str:
     """Get the path to the Python executable in the venv."""
-    # Find the uv-managed venv python
-    venv_python = Path(__file__).parent.parent / ".venv" / "bin" / "python"
-    if venv_python.exists():
-        return str(venv_python.resolve())
-    # Fallback to current python
-    return sys.executable
+    global _PYTHON_PATH
+    if _PYTHON_PATH is None:
+        # Find the uv-managed venv python
+        venv_python = Path(__file__).parent.parent / ".venv" / "bin" / "python"
+        if venv_python.exists():
+            _PYTHON_PATH = str(venv_python.resolve())
+        else:
+            # Fallback to current python
+            _PYTHON_PATH = sys.executable
+    return _PYTHON_PATH
 
 
 def _get_script_path() -> str:
@@ -342,72 +611,43 @@ def _get_script_path() -> str:
 
 
 def _find_uv_path() -> str:
-    """Find the uv executable."""
-    # Common locations for uv
-    candidates = [
-        Path.home() / ".cargo" / "bin" / "uv",
-        Path.home() / ".local" / "bin" / "uv",
-        Path("/opt/homebrew/bin/uv"),
-        Path("/usr/local/bin/uv"),
-    ]
-    for path in candidates:
-        if path.exists():
-            return str(path)
-    # Fallback - assume it's in PATH
-    return "uv"
+    """Find the uv executable (cached after the first lookup)."""
+    global _UV_PATH
+    if _UV_PATH is None:
+        # Common locations for uv
+        candidates = [
+            _HOME / ".cargo" / "bin" / "uv",
+            _HOME / ".local" / "bin" / "uv",
+            Path("/opt/homebrew/bin/uv"),
+            Path("/usr/local/bin/uv"),
+        ]
+        # Only stat candidates whose parent directory exists; on a typical
+        # machine half of these locations are absent entirely
+        parent_exists: dict[Path, bool] = {}
+        for path in candidates:
+            parent = path.parent
+            if parent not in parent_exists:
+                parent_exists[parent] = parent.is_dir()
+            if parent_exists[parent] and path.exists():
+                _UV_PATH = str(path)
+                break
+        else:
+            # Fallback - a single PATH walk, then assume it's in PATH
+            _UV_PATH = shutil.which("uv") or "uv"
+    return _UV_PATH
 
 
 def _generate_plist() -> str:
     """Generate the launchd plist XML."""
-    project_dir = Path(__file__).parent.parent.resolve()
-    uv_path = _find_uv_path()
-    
     LOG_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Use uv run to properly handle the venv and dependencies
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{LAUNCHD_LABEL}</string>
-    
-    <key>ProgramArguments</key>
-    <array>
-        <string>{uv_path}</string>
-        <string>run</string>
-        <string>voiceink-to-notion</string>
-        <string>sync</string>
-    </array>
-    
-    <key>WorkingDirectory</key>
-    <string>{project_dir}</string>
-    
-    <key>RunAtLoad</key>
-    <true/>
-    
-    <key>KeepAlive</key>
-    <true/>
-    
-    <key>StandardOutPath</key>
-    <string>{LOG_DIR}/stdout.log</string>
-    
-    <key>StandardErrorPath</key>
-    <string>{LOG_DIR}/stderr.log</string>
-    
-    <key>EnvironmentVariables</key>
-    <dict>
-        <key>PATH</key>
-        <string>{Path.home()}/.cargo/bin:{Path.home()}/.local/bin:/opt/homebrew/bin:/usr/local/bin:/usr/bin:/bin</string>
-        <key>HOME</key>
-        <string>{Path.home()}</string>
-    </dict>
-    
-    <key>ThrottleInterval</key>
-    <integer>30</integer>
-</dict>
-</plist>
-"""
+
+    return _PLIST_TEMPLATE.substitute(
+        label=LAUNCHD_LABEL,
+        uv_path=_find_uv_path(),
+        project_dir=_PROJECT_DIR,
+        log_dir=LOG_DIR,
+        home=_HOME,
+    )
 
 
 def _is_service_running() -> bool:
@@ -425,6 +665,10 @@ def _is_service_running() -> bool:
 
 def install_command(args):
     """Install as a launchd service."""
+    from rich.prompt import Confirm
+
+    from .notion_client import NotionClient, NotionConfig
+
     console.print("\n[bold blue]Installing VoiceInk to Notion Service[/bold blue]\n")
     
     # First, validate config exists and works
@@ -440,8 +684,7 @@ def install_command(args):
         database_id=config.notion_database_id,
     ))
     conn_result = client.test_connection()
-    client.close()
-    
+
     if not conn_result.success:
         console.print(f"[red]Notion connection failed: {conn_result.error}[/red]")
         console.print("Fix the config before installing the service.")
@@ -513,8 +756,20 @@ def uninstall_command(args):
     return 0
 
 
+def _tail_lines(path: Path, lines: int) -> str:
+    """Return the last N lines of a file without reading the whole thing."""
+    result = subprocess.run(
+        ["tail", "-n", str(lines), str(path)],
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
 def logs_command(args):
     """View service logs."""
+    from rich.text import Text
+
     stdout_log = LOG_DIR / "stdout.log"
     stderr_log = LOG_DIR / "stderr.log"
     
@@ -533,19 +788,21 @@ def logs_command(args):
         except KeyboardInterrupt:
             pass
     else:
-        # Show recent logs
+        # Show recent logs; tail reads only the end of the file, so this
+        # stays fast even after weeks of service output
         if stdout_log.exists():
             console.print(f"[bold]== stdout.log (last {lines} lines) ==[/bold]")
-            content = stdout_log.read_text()
-            recent = "\n".join(content.strip().split("\n")[-lines:])
-            console.print(recent or "[dim]Empty[/dim]")
-        
+            recent = _tail_lines(stdout_log, lines)
+            if recent:
+                console.print(Text(recent))
+            else:
+                console.print("[dim]Empty[/dim]")
+
         if stderr_log.exists():
             console.print(f"\n[bold]== stderr.log (last {lines} lines) ==[/bold]")
-            content = stderr_log.read_text()
-            recent = "\n".join(content.strip().split("\n")[-lines:])
+            recent = _tail_lines(stderr_log, lines)
             if recent:
-                console.print(f"[red]{recent}[/red]")
+                console.print(Text(recent, style="red"))
             else:
                 console.print("[dim]Empty[/dim]")
     
@@ -554,16 +811,17 @@ def logs_command(args):
 
 def service_status_command(args):
     """Check if the background service is running."""
+    from rich.text import Text
+
     if _is_service_running():
         console.print("[green]Service is running[/green]")
         
         # Show some stats
         stdout_log = LOG_DIR / "stdout.log"
         if stdout_log.exists():
-            content = stdout_log.read_text()
-            lines = content.strip().split("\n")
-            if lines:
-                console.print(f"[dim]Last log: {lines[-1][:80]}...[/dim]")
+            last_line = _tail_lines(stdout_log, 1)
+            if last_line:
+                console.print(Text(f"Last log: {last_line[:80]}...", style="dim"))
     else:
         if LAUNCHD_PLIST_PATH.exists():
             console.print("[yellow]Service is installed but not running[/yellow]")
@@ -1,6 +1,13 @@
 """Notion API client for creating pages in a database."""
 
+import asyncio
+import atexit
+import hashlib
+import random
+import time
+
 import httpx
+import orjson
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -8,6 +15,38 @@ from datetime import datetime
 NOTION_API_VERSION = "2022-06-28"
 NOTION_BASE_URL = "https://api.notion.com/v1"
 
+# Retry budget for rate-limited (429) and transient server (5xx) responses.
+# Notion rate-limits around 3 req/s, so retrying after its Retry-After hint
+# turns throttling into latency instead of failed pages.
+_MAX_RETRIES = 3
+_MAX_BACKOFF_SECONDS = 30.0
+
+# Connection-test errors by status code; anything else gets the generic form
+_ERROR_MESSAGES = {
+    404: "Database not found. Check the ID and make sure it's shared with your integration.",
+    401: "Invalid API key. Check your Notion integration token.",
+}
+
+
+def _should_retry(status_code: int) -> bool:
+    """Whether a response status warrants a retry."""
+    return status_code == 429 or status_code >= 500
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before the next attempt.
+
+    Honors Retry-After on 429s; otherwise exponential backoff with jitter
+    so concurrent requests don't retry in lockstep.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            return min(float(retry_after), _MAX_BACKOFF_SECONDS)
+        except ValueError:
+            pass
+    return min(2 ** attempt + random.random(), _MAX_BACKOFF_SECONDS)
+
 # Required properties for the database schema
 REQUIRED_PROPERTIES = {
     "Text": {"rich_text": {}},
@@ -16,6 +55,21 @@ REQUIRED_PROPERTIES = {
     "VoiceInk ID": {"rich_text": {}},
 }
 
+# Frozen views of the required property names, computed once at import so
+# check_schema doesn't rebuild them per call
+_REQUIRED_PROP_SET = frozenset(REQUIRED_PROPERTIES)
+_REQUIRED_PROP_LIST = tuple(REQUIRED_PROPERTIES)
+
+
+def schema_signature() -> str:
+    """Hash of the property set this code requires.
+
+    Persisted after a successful schema check so later runs can skip the
+    validation round-trip until the expectations here change.
+    """
+    joined = ",".join(sorted(REQUIRED_PROPERTIES))
+    return hashlib.blake2b(joined.encode(), digest_size=16).hexdigest()
+
 
 @dataclass
 class NotionConfig:
@@ -48,6 +102,9 @@ class NotionClient:
     
     def __init__(self, config: NotionConfig):
         self.config = config
+        # HTTP/2 lets requests multiplex over one TLS connection to
+        # api.notion.com; keep-alive plus transport retries avoid paying a
+        # handshake (or failing outright) per request
         self._client = httpx.Client(
             base_url=NOTION_BASE_URL,
             headers={
@@ -56,68 +113,111 @@ class NotionClient:
                 "Content-Type": "application/json",
             },
             timeout=30.0,
+            # With an explicit transport, httpx ignores http2/limits kwargs
+            # on the Client itself — they have to live on the transport
+            transport=httpx.HTTPTransport(
+                retries=2,
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=10,
+                    max_connections=20,
+                    keepalive_expiry=60.0,
+                ),
+            ),
         )
         self._title_property = "Name"  # Default, will be detected
-    
+        self._db_info: dict | None = None  # Cached GET /databases response
+        # The parent reference never changes for this client; serialize it
+        # once and splice the bytes into every page body
+        self._parent_bytes = _parent_fragment(config.database_id)
+        # The pooled connection (TCP + TLS) is reused across all requests in
+        # this process; close once at interpreter exit rather than between
+        # operations so chained calls keep the warm connection
+        atexit.register(self.close)
+
+    @property
+    def title_property(self) -> str:
+        """The detected title property name of the target database."""
+        return self._title_property
+
+    @title_property.setter
+    def title_property(self, value: str):
+        self._title_property = value
+
+    def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Issue a request, retrying rate-limited and 5xx responses.
+
+        Transport-level retries (connection failures) are handled by the
+        HTTPTransport; this covers responses that arrived but say "not now".
+        """
+        response = self._client.request(method, url, **kwargs)
+        for attempt in range(_MAX_RETRIES):
+            if not _should_retry(response.status_code):
+                break
+            time.sleep(_retry_delay(response, attempt))
+            response = self._client.request(method, url, **kwargs)
+        return response
+
+    def _fetch_db_info(self, force: bool = False) -> dict | None:
+        """Fetch (and memoize) the database metadata.
+
+        Every metadata consumer — connection test, schema check, info
+        display — reads the same endpoint, so one round-trip serves them
+        all for the lifetime of the client.
+        """
+        if self._db_info is not None and not force:
+            return self._db_info
+        try:
+            response = self._request_with_retry("GET", f"/databases/{self.config.database_id}")
+            if response.status_code == 200:
+                self._db_info = orjson.loads(response.content)
+                return self._db_info
+        except httpx.HTTPError:
+            pass
+        return None
+
     def test_connection(self) -> ConnectionResult:
         """Test that we can connect to the Notion database."""
         try:
-            response = self._client.get(f"/databases/{self.config.database_id}")
+            response = self._request_with_retry("GET", f"/databases/{self.config.database_id}")
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
+                self._db_info = data
                 title_parts = data.get("title", [])
                 db_name = title_parts[0]["plain_text"] if title_parts else "Untitled"
                 return ConnectionResult(success=True, database_name=db_name)
-            elif response.status_code == 404:
-                return ConnectionResult(
-                    success=False, 
-                    error="Database not found. Check the ID and make sure it's shared with your integration."
-                )
-            elif response.status_code == 401:
-                return ConnectionResult(
-                    success=False,
-                    error="Invalid API key. Check your Notion integration token."
-                )
-            else:
-                return ConnectionResult(
-                    success=False,
-                    error=f"Notion API error: {response.status_code}"
-                )
+            error = _ERROR_MESSAGES.get(
+                response.status_code, f"Notion API error: {response.status_code}"
+            )
+            return ConnectionResult(success=False, error=error)
         except httpx.HTTPError as e:
             return ConnectionResult(success=False, error=f"Connection failed: {e}")
     
     def check_schema(self) -> SchemaResult:
         """Check if database has required properties."""
-        try:
-            response = self._client.get(f"/databases/{self.config.database_id}")
-            if response.status_code != 200:
-                return SchemaResult(valid=False, missing_properties=list(REQUIRED_PROPERTIES.keys()))
-            
-            data = response.json()
-            properties = data.get("properties", {})
-            
-            # Find the title property name
-            for prop_name, prop_info in properties.items():
-                if prop_info.get("type") == "title":
-                    self._title_property = prop_name
-                    break
-            
-            # Check for required properties
-            existing = set(properties.keys())
-            required = set(REQUIRED_PROPERTIES.keys())
-            missing = required - existing
-            
-            if missing:
-                return SchemaResult(
-                    valid=False, 
-                    missing_properties=list(missing),
-                    title_property=self._title_property
-                )
-            
-            return SchemaResult(valid=True, title_property=self._title_property)
-            
-        except httpx.HTTPError:
-            return SchemaResult(valid=False, missing_properties=list(REQUIRED_PROPERTIES.keys()))
+        data = self._fetch_db_info()
+        if data is None:
+            return SchemaResult(valid=False, missing_properties=list(_REQUIRED_PROP_LIST))
+
+        properties = data.get("properties", {})
+
+        # Find the title property name
+        for prop_name, prop_info in properties.items():
+            if prop_info.get("type") == "title":
+                self._title_property = prop_name
+                break
+
+        # Check for required properties
+        missing = _REQUIRED_PROP_SET - properties.keys()
+
+        if missing:
+            return SchemaResult(
+                valid=False,
+                missing_properties=list(missing),
+                title_property=self._title_property
+            )
+
+        return SchemaResult(valid=True, title_property=self._title_property)
     
     def setup_schema(self) -> bool:
         """Add missing properties to the database."""
@@ -135,67 +235,94 @@ class NotionClient:
         }
         
         try:
-            response = self._client.patch(
+            response = self._request_with_retry(
+                "PATCH",
                 f"/databases/{self.config.database_id}",
-                json={"properties": properties_to_add}
+                content=orjson.dumps({"properties": properties_to_add})
             )
-            return response.status_code == 200
+            if response.status_code == 200:
+                # Properties changed; drop the cached metadata
+                self._db_info = None
+                return True
+            return False
         except httpx.HTTPError:
             return False
-    
+
     def get_database_info(self) -> dict | None:
         """Get information about the target database."""
-        try:
-            response = self._client.get(f"/databases/{self.config.database_id}")
-            if response.status_code == 200:
-                return response.json()
-        except httpx.HTTPError:
-            pass
-        return None
+        return self._fetch_db_info()
     
-    def get_all_synced_ids(self) -> set[str]:
-        """Query all pages in the database and extract VoiceInk IDs.
-        
+    def get_all_synced_ids(self, known_ids: set[str] | None = None) -> set[str]:
+        """Query pages in the database and extract VoiceInk IDs.
+
         This is used on first run to populate the local cache with
-        what's already been synced to Notion.
+        what's already been synced to Notion. Only the VoiceInk ID
+        property is fetched per page (filter_properties), and pages are
+        walked newest-first; when known_ids is given, the walk stops at
+        the first page containing nothing new, since everything older is
+        already cached.
         """
         synced_ids = set()
         start_cursor = None
-        
+
+        # Resolve the property's opaque id so the query can project just
+        # that one column instead of the full properties dict per page
+        params = {}
+        info = self.get_database_info()
+        if info:
+            voiceink_id_prop = info.get("properties", {}).get("VoiceInk ID", {})
+            if voiceink_id_prop.get("id"):
+                params["filter_properties"] = [voiceink_id_prop["id"]]
+
         while True:
-            payload = {"page_size": 100}
+            payload = {
+                "page_size": 100,
+                "sorts": [{"timestamp": "created_time", "direction": "descending"}],
+            }
             if start_cursor:
                 payload["start_cursor"] = start_cursor
-            
+
             try:
-                response = self._client.post(
+                response = self._request_with_retry(
+                    "POST",
                     f"/databases/{self.config.database_id}/query",
-                    json=payload
+                    params=params,
+                    content=orjson.dumps(payload)
                 )
-                
+
                 if response.status_code != 200:
                     break
-                
-                data = response.json()
-                
+
+                data = orjson.loads(response.content)
+
+                found_new = False
                 for page in data.get("results", []):
-                    properties = page.get("properties", {})
-                    voiceink_id_prop = properties.get("VoiceInk ID", {})
-                    rich_text = voiceink_id_prop.get("rich_text", [])
-                    if rich_text:
-                        voiceink_id = rich_text[0].get("plain_text", "")
-                        if voiceink_id:
-                            synced_ids.add(voiceink_id)
-                
+                    # Direct path to the one field we project; missing or
+                    # empty properties are skipped via the exception path
+                    # rather than allocating default dicts at each level
+                    try:
+                        voiceink_id = page["properties"]["VoiceInk ID"]["rich_text"][0]["plain_text"]
+                    except (KeyError, IndexError):
+                        continue
+                    if voiceink_id:
+                        if known_ids is None or voiceink_id not in known_ids:
+                            found_new = True
+                        synced_ids.add(voiceink_id)
+
+                # A page of all-known IDs means the rest of the walk is
+                # already in the local cache
+                if known_ids is not None and not found_new:
+                    break
+
                 # Check for more pages
                 if data.get("has_more") and data.get("next_cursor"):
                     start_cursor = data["next_cursor"]
                 else:
                     break
-                    
+
             except httpx.HTTPError:
                 break
-        
+
         return synced_ids
     
     def create_transcription_page(
@@ -208,106 +335,274 @@ class NotionClient:
         voiceink_id: str | None = None,
     ) -> dict | None:
         """Create a new page in the Notion database for a transcription.
-        
+
         The database should have these properties:
         - Title (title): The transcription text or a summary
-        - Text (rich_text): The full transcription text  
+        - Text (rich_text): The full transcription text
         - Timestamp (date): When the transcription was created
         - Duration (number): Recording duration in seconds
         - Enhanced Text (rich_text): AI-enhanced version if available
         - Prompt (rich_text): The prompt/mode used
         - VoiceInk ID (rich_text): Unique ID from VoiceInk for deduplication
         """
-        # Truncate title to 100 chars for readability
-        title = text[:100] + "..." if len(text) > 100 else text
-        
-        # Build properties matching the database schema
-        # Use detected title property name (default is "Name")
-        properties = {
-            self._title_property: {
-                "title": [{"text": {"content": title}}]
-            },
-            "Text": {
-                "rich_text": [{"text": {"content": text[:2000]}}]  # Notion limit
-            },
-            "Timestamp": {
-                "date": {"start": timestamp.isoformat()}
-            },
-            "Duration": {
-                "number": round(duration, 2)
-            },
-        }
-        
-        if voiceink_id:
-            properties["VoiceInk ID"] = {
-                "rich_text": [{"text": {"content": voiceink_id}}]
-            }
-        
-        # Build page content with full text as blocks
-        children = []
-        
-        # Split long text into multiple paragraph blocks (Notion has block limits)
-        remaining_text = text
-        while remaining_text:
-            chunk = remaining_text[:2000]
-            remaining_text = remaining_text[2000:]
-            children.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": chunk}}]
-                }
-            })
-        
-        if enhanced_text:
-            children.append({
-                "object": "block",
-                "type": "heading_2",
-                "heading_2": {
-                    "rich_text": [{"type": "text", "text": {"content": "Enhanced Version"}}]
-                }
-            })
-            remaining_enhanced = enhanced_text
-            while remaining_enhanced:
-                chunk = remaining_enhanced[:2000]
-                remaining_enhanced = remaining_enhanced[2000:]
-                children.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": [{"type": "text", "text": {"content": chunk}}]
-                    }
-                })
-        
-        payload = {
-            "parent": {"database_id": self.config.database_id},
-            "properties": properties,
-            "children": children[:100],  # Notion limit
-        }
-        
+        properties, minimal_properties, children = _build_page_parts(
+            self._title_property,
+            text,
+            timestamp,
+            duration,
+            enhanced_text=enhanced_text,
+            voiceink_id=voiceink_id,
+        )
+
         try:
-            response = self._client.post("/pages", json=payload)
-            
+            response = self._request_with_retry(
+                "POST", "/pages",
+                content=_page_body(self._parent_bytes, properties, children),
+            )
+
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
             else:
                 # Try with minimal properties if full set fails
-                minimal_payload = {
-                    "parent": {"database_id": self.config.database_id},
-                    "properties": {
-                        self._title_property: {"title": [{"text": {"content": title}}]}
-                    },
-                    "children": children[:100],
-                }
-                response = self._client.post("/pages", json=minimal_payload)
+                response = self._request_with_retry(
+                    "POST", "/pages",
+                    content=_page_body(self._parent_bytes, minimal_properties, children),
+                )
                 if response.status_code == 200:
-                    return response.json()
-                    
+                    return orjson.loads(response.content)
+
         except httpx.HTTPError as e:
             print(f"HTTP error creating page: {e}")
-        
+
         return None
-    
+
     def close(self):
+        """Close the HTTP client (idempotent; also registered via atexit)."""
+        if not self._client.is_closed:
+            self._client.close()
+
+
+class AsyncNotionClient:
+    """Async Notion client used to create pages concurrently.
+
+    The metadata calls (connection test, schema setup) stay on the
+    synchronous NotionClient; this client exists for the upload fan-out,
+    where each POST is mostly network wait and several can be in flight
+    at once over the pooled connection.
+    """
+
+    def __init__(self, config: NotionConfig, title_property: str = "Name"):
+        self.config = config
+        self._title_property = title_property
+        self._parent_bytes = _parent_fragment(config.database_id)
+        self._client = httpx.AsyncClient(
+            base_url=NOTION_BASE_URL,
+            headers={
+                "Authorization": f"Bearer {config.api_key}",
+                "Notion-Version": NOTION_API_VERSION,
+                "Content-Type": "application/json",
+            },
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+
+    async def __aenter__(self) -> "AsyncNotionClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def _request_with_retry(self, method: str, url: str, **kwargs) -> httpx.Response:
+        """Async counterpart of NotionClient._request_with_retry."""
+        response = await self._client.request(method, url, **kwargs)
+        for attempt in range(_MAX_RETRIES):
+            if not _should_retry(response.status_code):
+                break
+            await asyncio.sleep(_retry_delay(response, attempt))
+            response = await self._client.request(method, url, **kwargs)
+        return response
+
+    async def create_transcription_page(
+        self,
+        text: str,
+        timestamp: datetime,
+        duration: float,
+        enhanced_text: str | None = None,
+        prompt_name: str | None = None,
+        voiceink_id: str | None = None,
+    ) -> dict | None:
+        """Async variant of NotionClient.create_transcription_page."""
+        properties, minimal_properties, children = _build_page_parts(
+            self._title_property,
+            text,
+            timestamp,
+            duration,
+            enhanced_text=enhanced_text,
+            voiceink_id=voiceink_id,
+        )
+
+        try:
+            response = await self._request_with_retry(
+                "POST", "/pages",
+                content=_page_body(self._parent_bytes, properties, children),
+            )
+
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+
+            # Try with minimal properties if full set fails
+            response = await self._request_with_retry(
+                "POST", "/pages",
+                content=_page_body(self._parent_bytes, minimal_properties, children),
+            )
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+
+        except httpx.HTTPError:
+            pass
+
+        return None
+
+    async def create_transcription_pages(
+        self,
+        transcriptions: list,
+        max_in_flight: int = 3,
+        on_result=None,
+    ) -> int:
+        """Create pages for many transcriptions concurrently.
+
+        Takes Transcription records (anything with id/text/timestamp/
+        duration/enhanced_text/prompt_name attributes). Concurrency is
+        capped by a semaphore — Notion allows ~3 requests per second, so
+        3 in flight keeps throughput at the rate limit without tripping
+        it; 429s that slip through are retried with backoff by
+        _request_with_retry. If on_result is given it's called as
+        on_result(transcription, result) as each page finishes, in
+        completion order. Returns the number of pages created.
+        """
+        sem = asyncio.Semaphore(max_in_flight)
+
+        async def create(t):
+            async with sem:
+                result = await self.create_transcription_page(
+                    text=t.text,
+                    timestamp=t.timestamp,
+                    duration=t.duration,
+                    enhanced_text=t.enhanced_text,
+                    prompt_name=t.prompt_name,
+                    voiceink_id=t.id,
+                )
+            return t, result
+
+        count = 0
+        for coro in asyncio.as_completed([create(t) for t in transcriptions]):
+            t, result = await coro
+            if result:
+                count += 1
+            if on_result is not None:
+                on_result(t, result)
+        return count
+
+    async def close(self):
         """Close the HTTP client."""
-        self._client.close()
+        if not self._client.is_closed:
+            await self._client.aclose()
+
+
+def _chunks(s: str, n: int = 2000):
+    """Yield successive n-char slices of s.
+
+    Index-based slicing touches each character once, unlike repeatedly
+    re-slicing the remaining tail (which is quadratic for long strings).
+    """
+    for i in range(0, len(s), n):
+        yield s[i:i + n]
+
+
+def _paragraph_block(content: str) -> dict:
+    """Build a Notion paragraph block for a chunk of text."""
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [{"type": "text", "text": {"content": content}}]
+        }
+    }
+
+
+def _build_properties(
+    title_property: str,
+    title: str,
+    text: str,
+    timestamp: datetime,
+    duration: float,
+    voiceink_id: str | None,
+) -> dict:
+    """Build the properties dict for a page, matching the database schema."""
+    # One dict literal so CPython builds it with BUILD_MAP instead of
+    # repeated __setitem__ calls; use detected title property name
+    properties = {
+        title_property: {"title": [{"text": {"content": title}}]},
+        "Text": {"rich_text": [{"text": {"content": text[:2000]}}]},  # Notion limit
+        "Timestamp": {"date": {"start": timestamp.isoformat()}},
+        "Duration": {"number": round(duration, 2)},
+    }
+    if voiceink_id:
+        properties["VoiceInk ID"] = {"rich_text": [{"text": {"content": voiceink_id}}]}
+    return properties
+
+
+def _parent_fragment(database_id: str) -> bytes:
+    """Serialized '"parent": {...}' fragment, minus the enclosing braces."""
+    return orjson.dumps({"parent": {"database_id": database_id}})[1:-1]
+
+
+def _page_body(parent_bytes: bytes, properties: dict, children: list) -> bytes:
+    """Assemble a /pages request body around a precomputed parent fragment.
+
+    The parent never changes for a client, so its bytes are spliced in
+    rather than re-serialized with every page; only the dynamic half goes
+    through orjson. Dropping the opening brace of the dynamic part keeps
+    the concatenation a valid JSON object.
+    """
+    dynamic = orjson.dumps({"properties": properties, "children": children})
+    return b"{" + parent_bytes + b"," + dynamic[1:]
+
+
+def _build_page_parts(
+    title_property: str,
+    text: str,
+    timestamp: datetime,
+    duration: float,
+    enhanced_text: str | None = None,
+    voiceink_id: str | None = None,
+) -> tuple[dict, dict, list]:
+    """Build properties, the minimal fallback properties, and children."""
+    # Truncate title to 100 chars for readability
+    title = text[:100] + "..." if len(text) > 100 else text
+
+    properties = _build_properties(
+        title_property, title, text, timestamp, duration, voiceink_id
+    )
+
+    # Build page content with full text as blocks, split into paragraph
+    # chunks (Notion has block limits)
+    children = [_paragraph_block(chunk) for chunk in _chunks(text)]
+
+    if enhanced_text:
+        children.append({
+            "object": "block",
+            "type": "heading_2",
+            "heading_2": {
+                "rich_text": [{"type": "text", "text": {"content": "Enhanced Version"}}]
+            }
+        })
+        children.extend(_paragraph_block(chunk) for chunk in _chunks(enhanced_text))
+
+    children = children[:100]  # Notion limit
+
+    minimal_properties = {
+        title_property: {"title": [{"text": {"content": title}}]}
+    }
+    return properties, minimal_properties, children
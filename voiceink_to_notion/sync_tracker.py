@@ -1,33 +1,112 @@
 """Track which transcriptions have been synced to Notion."""
 
-import json
+import hashlib
+import os
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
+# Salt for hashing the API key so a config change invalidates the cached
+# connection check without storing the key itself (blake2b salt max 16 bytes)
+_API_KEY_SALT = b"voiceink-notion"
+
+# How long a successful connection check stays valid
+CONNECTION_CHECK_TTL_SECONDS = 60
+
+
+def hash_api_key(api_key: str) -> str:
+    """Salted hash of the Notion API key for change detection."""
+    return hashlib.blake2b(api_key.encode(), salt=_API_KEY_SALT).hexdigest()
+
 
 @dataclass
 class SyncState:
     """Tracks sync state to avoid duplicates."""
-    
+
     synced_ids: set[str] = field(default_factory=set)
     last_sync_time: datetime | None = None
     notion_cache_populated: bool = False  # Whether we've fetched from Notion
-    
+    last_connection_check_ts: float | None = None
+    last_connection_db_name: str | None = None
+    api_key_hash: str | None = None
+    title_property: str | None = None  # Detected Notion title property
+    schema_hash: str | None = None  # Signature of the last validated schema
+
     def mark_synced(self, voiceink_id: str):
         """Mark a transcription as synced."""
         self.synced_ids.add(voiceink_id)
         self.last_sync_time = datetime.now()
-    
+
     def is_synced(self, voiceink_id: str) -> bool:
         """Check if a transcription has already been synced."""
         return voiceink_id in self.synced_ids
-    
+
     def merge_notion_ids(self, notion_ids: set[str]):
         """Merge IDs fetched from Notion into local state."""
         self.synced_ids.update(notion_ids)
         self.notion_cache_populated = True
 
+    def record_connection(self, db_name: str | None, key_hash: str):
+        """Record a successful connection check for short-lived reuse."""
+        self.last_connection_check_ts = time.time()
+        self.last_connection_db_name = db_name
+        self.api_key_hash = key_hash
+
+    def connection_fresh(self, key_hash: str) -> bool:
+        """Whether a recent connection check with the same key can be reused."""
+        return (
+            self.last_connection_check_ts is not None
+            and self.api_key_hash == key_hash
+            and time.time() - self.last_connection_check_ts < CONNECTION_CHECK_TTL_SECONDS
+        )
+
+
+class SyncBatch:
+    """Collects successfully synced IDs and flushes state in batches.
+
+    Use as a context manager around a sync cycle: call add() per success
+    and the state file is written at most once per CHECKPOINT_EVERY items
+    plus once on exit (including on an exception), instead of per item.
+    """
+
+    CHECKPOINT_EVERY = 25
+
+    def __init__(self, state: SyncState):
+        self.state = state
+        self._pending: list[str] = []
+
+    def __enter__(self) -> "SyncBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._flush()
+        return False
+
+    def add(self, voiceink_id: str):
+        """Record a successfully synced transcription."""
+        self._pending.append(voiceink_id)
+        if len(self._pending) >= self.CHECKPOINT_EVERY:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        for voiceink_id in self._pending:
+            self.state.mark_synced(voiceink_id)
+        append_synced_ids(self._pending)
+        self._pending.clear()
+
+        # Compact once the log outgrows the snapshot; until then each
+        # flush only appends O(new) bytes instead of rewriting the set
+        state_file = get_state_file_path()
+        log_file = get_log_file_path()
+        snapshot_size = state_file.stat().st_size if state_file.exists() else 0
+        if log_file.exists() and log_file.stat().st_size > snapshot_size:
+            save_sync_state(self.state, truncate_log=True)
+
 
 def get_state_file_path() -> Path:
     """Get the path to the sync state file."""
@@ -37,34 +116,96 @@ def get_state_file_path() -> Path:
     return config_dir / "sync_state.json"
 
 
+def get_log_file_path() -> Path:
+    """Get the path to the append-only synced-ID log."""
+    return get_state_file_path().with_suffix(".log")
+
+
+def append_synced_ids(voiceink_ids: list[str]):
+    """Append newly synced IDs to the log.
+
+    The log complements the JSON snapshot: writing a batch costs O(batch)
+    bytes instead of rewriting the whole ID set, and load_sync_state
+    replays it to recover anything synced since the last full save.
+    """
+    if not voiceink_ids:
+        return
+    with get_log_file_path().open("ab") as f:
+        f.write("".join(f"{voiceink_id}\n" for voiceink_id in voiceink_ids).encode())
+
+
 def load_sync_state() -> SyncState:
-    """Load sync state from disk."""
+    """Load sync state from disk (snapshot plus append-log replay)."""
     state_file = get_state_file_path()
-    
+
     if not state_file.exists():
-        return SyncState()
-    
+        state = SyncState()
+        _replay_log(state)
+        return state
+
     try:
-        data = json.loads(state_file.read_text())
+        data = orjson.loads(state_file.read_bytes())
         state = SyncState(
             synced_ids=set(data.get("synced_ids", [])),
             notion_cache_populated=data.get("notion_cache_populated", False),
+            last_connection_check_ts=data.get("last_connection_check_ts"),
+            last_connection_db_name=data.get("last_connection_db_name"),
+            api_key_hash=data.get("api_key_hash"),
+            title_property=data.get("title_property"),
+            schema_hash=data.get("schema_hash"),
         )
         if data.get("last_sync_time"):
             state.last_sync_time = datetime.fromisoformat(data["last_sync_time"])
-        return state
-    except (json.JSONDecodeError, KeyError):
-        return SyncState()
+    except (orjson.JSONDecodeError, KeyError):
+        state = SyncState()
+
+    _replay_log(state)
+    return state
+
+
+def _replay_log(state: SyncState):
+    """Merge IDs from the append log into the state."""
+    log_file = get_log_file_path()
+    if log_file.exists():
+        for line in log_file.read_bytes().splitlines():
+            if line:
+                state.synced_ids.add(line.decode())
+
 
+def save_sync_state(state: SyncState, *, truncate_log: bool = False):
+    """Save sync state to disk atomically.
 
-def save_sync_state(state: SyncState):
-    """Save sync state to disk."""
+    Other processes may append to the log while this one holds an older
+    state in memory — the status command and setup both save metadata
+    seconds after loading while the sync daemon runs. The log is replayed
+    into the snapshot right before writing so those appends survive, and
+    it is only truncated when the caller owns the log (SyncBatch's
+    compaction inside the sync process).
+    """
     state_file = get_state_file_path()
-    
+    _replay_log(state)
+
     data = {
         "synced_ids": list(state.synced_ids),
         "last_sync_time": state.last_sync_time.isoformat() if state.last_sync_time else None,
         "notion_cache_populated": state.notion_cache_populated,
+        "last_connection_check_ts": state.last_connection_check_ts,
+        "last_connection_db_name": state.last_connection_db_name,
+        "api_key_hash": state.api_key_hash,
+        "title_property": state.title_property,
+        "schema_hash": state.schema_hash,
     }
-    
-    state_file.write_text(json.dumps(data, indent=2))
+
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+    # Write to a temp file and rename so a crash mid-write can't leave a
+    # truncated state file behind
+    tmp_file = state_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(payload)
+    os.replace(tmp_file, state_file)
+
+    if truncate_log:
+        # The snapshot now holds everything, so the append log is redundant
+        log_file = get_log_file_path()
+        if log_file.exists():
+            log_file.write_bytes(b"")
@@ -1,6 +1,9 @@
 """Read transcriptions from VoiceInk's SwiftData SQLite database."""
 
+import os
 import sqlite3
+import uuid
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -19,13 +22,28 @@ class Transcription:
     power_mode_name: str | None
 
 
+# Memoized result of the last successful search; re-verified before reuse
+# so a deleted store triggers a fresh scan
+_FOUND_DB_PATH: Path | None = None
+
+
 def find_voiceink_database() -> Path | None:
-    """Find VoiceInk's SwiftData database on disk.
-    
+    """Find VoiceInk's SwiftData database on disk (cached after first hit).
+
     SwiftData stores data in SQLite format. VoiceInk could be:
     - Sandboxed app: ~/Library/Containers/com.prakashjoshipax.VoiceInk/...
     - Non-sandboxed: ~/Library/Application Support/com.prakashjoshipax.VoiceInk/...
     """
+    global _FOUND_DB_PATH
+    if _FOUND_DB_PATH is not None and _FOUND_DB_PATH.is_file():
+        return _FOUND_DB_PATH
+
+    _FOUND_DB_PATH = _search_voiceink_database()
+    return _FOUND_DB_PATH
+
+
+def _search_voiceink_database() -> Path | None:
+    """Walk the candidate directories looking for VoiceInk's store file."""
     home = Path.home()
     
     # Possible locations for VoiceInk data (most specific first)
@@ -39,59 +57,89 @@ def find_voiceink_database() -> Path | None:
     ]
     
     for base_path in candidates:
-        if not base_path.exists():
+        # One scandir pass per directory instead of stat + two globs;
+        # default.store (SwiftData's default name) wins outright, then any
+        # other .store, then .sqlite files
+        try:
+            entries = os.scandir(base_path)
+        except OSError:
             continue
-        
-        # Look for default.store first (SwiftData's default name)
-        default_store = base_path / "default.store"
-        if default_store.is_file():
-            return default_store
-        
-        # SwiftData creates a default.store file or similar
-        for db_file in base_path.glob("*.store"):
-            # Skip dictionary.store - that's for vocabulary, not transcriptions
-            if db_file.name == "dictionary.store":
-                continue
-            if db_file.is_file():
-                return db_file
-        
-        # Also check for .sqlite files
-        for db_file in base_path.glob("*.sqlite"):
-            if db_file.is_file():
-                return db_file
-    
+
+        stores: list[str] = []
+        sqlites: list[str] = []
+        with entries:
+            for entry in entries:
+                # Skip dictionary.store - that's for vocabulary, not transcriptions
+                if entry.name == "dictionary.store" or not entry.is_file():
+                    continue
+                if entry.name == "default.store":
+                    return Path(entry.path)
+                if entry.name.endswith(".store"):
+                    stores.append(entry.path)
+                elif entry.name.endswith(".sqlite"):
+                    sqlites.append(entry.path)
+        if stores:
+            return Path(stores[0])
+        if sqlites:
+            return Path(sqlites[0])
+
     return None
 
 
+# Core Data reference date is 2001-01-01 00:00:00 UTC
+_CORE_DATA_EPOCH = datetime(2001, 1, 1)
+
+
 def _parse_swiftdata_timestamp(value: float | None) -> datetime:
     """Parse SwiftData/Core Data timestamp (seconds since 2001-01-01)."""
     if value is None:
         return datetime.now()
-    
-    # Core Data reference date is 2001-01-01 00:00:00 UTC
-    core_data_epoch = datetime(2001, 1, 1)
-    return datetime.fromtimestamp(core_data_epoch.timestamp() + value)
 
+    return datetime.fromtimestamp(_CORE_DATA_EPOCH.timestamp() + value)
+
+
+def _to_swiftdata_timestamp(value: datetime) -> float:
+    """Convert a datetime back to Core Data epoch seconds."""
+    return value.timestamp() - _CORE_DATA_EPOCH.timestamp()
+
+
+def read_transcriptions(
+    db_path: Path,
+    limit: int | None = None,
+    since: datetime | None = None,
+) -> Iterator[Transcription]:
+    """Yield transcriptions from VoiceInk's database, newest first.
 
-def read_transcriptions(db_path: Path) -> list[Transcription]:
-    """Read all transcriptions from VoiceInk's database.
-    
     VoiceInk uses SwiftData which stores data in SQLite with Core Data conventions:
     - Table: ZTRANSCRIPTION
     - Columns prefixed with Z
     - Timestamps in Core Data epoch (seconds since 2001-01-01)
     - UUIDs stored as blobs
+
+    If limit is given, only the most recent rows are fetched (the limit is
+    applied in SQL so the database does the top-K selection). If since is
+    given, only rows strictly newer than it are returned — the filter runs
+    in SQL, so repeat reads cost O(new) instead of O(all).
+
+    Rows are fetched in arraysize batches via fetchmany and yielded one
+    at a time, so callers that don't need the whole history never hold
+    it in memory; wrap in list() where a full list is wanted.
     """
-    transcriptions = []
-    
     try:
-        conn = sqlite3.connect(str(db_path))
-        conn.row_factory = sqlite3.Row
+        # Open read-only so we can never take a write lock on (or corrupt)
+        # VoiceInk's live store. Not immutable=1: VoiceInk writes while we
+        # read, and immutable tells SQLite the file can't change.
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        conn.execute("PRAGMA query_only=1")
+        # mmap the store so page reads skip userspace copies
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-64000")
         cursor = conn.cursor()
-        
+        cursor.arraysize = 1000
+
         # Query the ZTRANSCRIPTION table directly
         query = """
-            SELECT 
+            SELECT
                 Z_PK,
                 hex(ZID) as ZID_HEX,
                 ZTEXT,
@@ -103,32 +151,50 @@ def read_transcriptions(db_path: Path) -> list[Transcription]:
                 ZTRANSCRIPTIONSTATUS
             FROM ZTRANSCRIPTION
             WHERE ZTEXT IS NOT NULL AND ZTEXT != ''
-            ORDER BY ZTIMESTAMP DESC
         """
-        
-        cursor.execute(query)
-        
-        for row in cursor.fetchall():
-            # Use hex UUID as the ID, or fall back to primary key
-            record_id = row["ZID_HEX"] or str(row["Z_PK"])
-            
-            # Format UUID properly if it's a hex string (32 chars)
-            if record_id and len(record_id) == 32:
-                record_id = f"{record_id[:8]}-{record_id[8:12]}-{record_id[12:16]}-{record_id[16:20]}-{record_id[20:]}"
-            
-            transcriptions.append(Transcription(
-                id=record_id,
-                text=row["ZTEXT"],
-                enhanced_text=row["ZENHANCEDTEXT"],
-                timestamp=_parse_swiftdata_timestamp(row["ZTIMESTAMP"]),
-                duration=row["ZDURATION"] or 0.0,
-                prompt_name=row["ZPROMPTNAME"],
-                power_mode_name=row["ZPOWERMODENAME"],
-            ))
-        
-        conn.close()
-        
+        params: list = []
+
+        if since is not None:
+            query += " AND ZTIMESTAMP > ?"
+            params.append(_to_swiftdata_timestamp(since))
+
+        query += " ORDER BY ZTIMESTAMP DESC"
+
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        cursor.execute(query, params)
     except sqlite3.Error as e:
         raise RuntimeError(f"Failed to read VoiceInk database: {e}") from e
-    
-    return transcriptions
+
+    try:
+        # fetchmany batches (cursor iteration steps a single row per call;
+        # arraysize only applies to fetchmany), with plain tuples unpacked
+        # positionally matching the SELECT order — sqlite3.Row's per-column
+        # hash lookups add up over large histories
+        while rows := cursor.fetchmany():
+            for pk, zid_hex, text, enhanced, ts, dur, prompt, power_mode, _status in rows:
+                # Use hex UUID as the ID, or fall back to primary key
+                record_id = zid_hex or str(pk)
+
+                # Format UUID properly if it's a hex string (32 chars);
+                # uuid's C-level parse/format beats manual slicing per row.
+                # Keep it uppercase — SQLite's hex() is uppercase and that's
+                # what previously synced IDs look like.
+                if record_id and len(record_id) == 32:
+                    record_id = str(uuid.UUID(hex=record_id)).upper()
+
+                yield Transcription(
+                    id=record_id,
+                    text=text,
+                    enhanced_text=enhanced,
+                    timestamp=_parse_swiftdata_timestamp(ts),
+                    duration=dur or 0.0,
+                    prompt_name=prompt,
+                    power_mode_name=power_mode,
+                )
+    except sqlite3.Error as e:
+        raise RuntimeError(f"Failed to read VoiceInk database: {e}") from e
+    finally:
+        conn.close()